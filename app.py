@@ -18,7 +18,8 @@ if 'dark_mode' not in st.session_state:
 # Fixed values
 # Use absolute path relative to this script's directory
 SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
-DATA_FILE = os.path.join(SCRIPT_DIR, "data.xlsx")
+# LAND_RECORD_DATA_FILE can point to another workbook (used by load_test.py)
+DATA_FILE = os.environ.get("LAND_RECORD_DATA_FILE", os.path.join(SCRIPT_DIR, "data.xlsx"))
 
 # Dictionary for languages
 TRANSLATIONS = {
@@ -65,7 +66,7 @@ TRANSLATIONS = {
 def load_all_sheets():
     try:
         if not os.path.exists(DATA_FILE):
-            st.error(f"Error: {DATA_FILE} not found. Please ensure the file exists in the root directory.")
+            st.error(f"Error: {DATA_FILE} not found. Add data.xlsx next to app.py or set LAND_RECORD_DATA_FILE to the workbook path.")
             return None
         # Read the Excel file into a dictionary of DataFrames
         xls = pd.read_excel(DATA_FILE, sheet_name=None, header=None)
@@ -80,7 +81,7 @@ def find_header_row(df):
     """
     keywords = ['कित्ता', 'साविक', 'वडा', 'सिट', 'भूउपयोग', 'सि.नं.', 'Plot', 'Ward', 'Sheet', 'VDC']
     for i in range(min(10, len(df))):
-        row_values = df.iloc[i].astype(str).tolist()
+        row_values = df.iloc[i].fillna("").astype(str).tolist()
         match_count = sum(1 for val in row_values if any(k.lower() in val.lower() for k in keywords))
         if match_count >= 2:
             return i
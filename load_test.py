@@ -0,0 +1,300 @@
+"""
+Load test for app.py.
+
+Runs many simulated user sessions at the same time with Streamlit's AppTest
+(no browser needed) against a generated Excel workbook, and prints rerun
+latency, throughput and memory for each concurrency level.
+
+AppTest keeps one Streamlit runtime per process, so every session runs in its
+own process. That means each session has its own st.cache_data: the first
+(cold) run that reads the workbook is reported separately and left out of the
+latency percentiles. Memory columns are per session process.
+
+Example:
+    python load_test.py --levels 1 2 4 8 --iterations 3
+"""
+import argparse
+import multiprocessing
+import os
+import random
+import resource
+import statistics
+import tempfile
+import time
+from queue import Empty
+
+import pandas as pd
+
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+APP_FILE = os.path.join(SCRIPT_DIR, "app.py")
+
+# Same header text as the real workbook so find_header_row/identify_columns match
+HEADERS = ["सि.नं.", "साविक गा.वि.स.", "वडा नं.", "सिट नं.", "कित्ता नं.", "भूउपयोग क्षेत्र"]
+LAND_USES = ["कृषि क्षेत्र", "आवासीय क्षेत्र", "व्यवसायिक क्षेत्र", "वन क्षेत्र", "सार्वजनिक क्षेत्र"]
+
+# Reruns in one Session.flow()
+RERUNS_PER_FLOW = 5
+
+
+def make_workbook(path, vdcs, rows_per_vdc, seed=0):
+    """
+    Write a workbook shaped like data.xlsx: a cover sheet, then one sheet per VDC
+    with a title row and a blank row above the header.
+    """
+    rng = random.Random(seed)
+    with pd.ExcelWriter(path, engine="openpyxl") as writer:
+        pd.DataFrame([["Land Record Search System"]]).to_excel(
+            writer, sheet_name="Cover", header=False, index=False
+        )
+        for v in range(vdcs):
+            vdc_name = f"VDC {v + 1}"
+            blank = [None] * len(HEADERS)
+            title = [None, f"{vdc_name} भू-उपयोग क्षेत्र वर्गीकरण"] + [None] * (len(HEADERS) - 2)
+            rows = [title, blank, HEADERS]
+            for i in range(rows_per_vdc):
+                rows.append([
+                    i + 1,
+                    vdc_name,
+                    rng.randint(1, 9),
+                    rng.randint(1, 30),
+                    rng.randint(1, 5000),
+                    rng.choice(LAND_USES),
+                ])
+            pd.DataFrame(rows).to_excel(writer, sheet_name=vdc_name, header=False, index=False)
+
+
+def current_rss_mb():
+    """
+    Resident memory of this process right now (Linux), else the peak.
+    """
+    try:
+        with open("/proc/self/statm") as f:
+            pages = int(f.read().split()[1])
+        return pages * os.sysconf("SC_PAGE_SIZE") / (1024 * 1024)
+    except (OSError, ValueError):
+        return peak_rss_mb()
+
+
+def peak_rss_mb():
+    # ru_maxrss is in KB on Linux
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+
+def percentile(values, pct):
+    ordered = sorted(values)
+    if not ordered:
+        return 0.0
+    k = (len(ordered) - 1) * pct / 100
+    low = int(k)
+    high = min(low + 1, len(ordered) - 1)
+    return ordered[low] + (ordered[high] - ordered[low]) * (k - low)
+
+
+class Session:
+    """
+    One simulated user. Every call to rerun() is timed.
+    """
+
+    def __init__(self, timeout, rng):
+        from streamlit import config, logger
+        from streamlit.testing.v1 import AppTest
+
+        # AppTest runs outside a server, so hide the "missing ScriptRunContext"
+        # and deprecation warnings it would log on every rerun
+        config.set_option("logger.level", "error")
+        logger.set_log_level("error")
+
+        self.at = AppTest.from_file(APP_FILE, default_timeout=timeout)
+        self.rng = rng
+        self.latencies = []
+        self.errors = 0
+
+    def rerun(self, widget=None):
+        start = time.perf_counter()
+        if widget is None:
+            self.at.run()
+        else:
+            widget.run()
+        self.latencies.append(time.perf_counter() - start)
+        if self.at.exception:
+            self.errors += 1
+            print(f"  rerun raised: {self.at.exception[0].message}")
+
+    def check_loaded(self):
+        """
+        load_all_sheets reports a missing or unreadable workbook with st.error,
+        not an exception, so check for the VDC selectbox instead.
+        """
+        if self.at.error or not self.at.sidebar.selectbox:
+            reason = self.at.error[0].value if self.at.error else "no VDC selectbox"
+            raise RuntimeError(f"app did not load the workbook: {reason}")
+
+    def flow(self):
+        """
+        Pick a VDC, choose a ward, search a plot, toggle the theme, switch language.
+        """
+        at = self.at
+        vdc_box = at.sidebar.selectbox[0]
+        self.rerun(vdc_box.set_value(self.rng.choice(vdc_box.options)))
+
+        # Form widgets only take effect when the form is submitted
+        ward_box = at.sidebar.selectbox[1]
+        ward_box.set_value(self.rng.choice(ward_box.options))
+        self.rerun(at.sidebar.button[0].click())
+
+        at.sidebar.text_input[0].input(str(self.rng.randint(1, 500)))
+        self.rerun(at.sidebar.button[0].click())
+
+        self.rerun(at.button(key="theme_toggle").click())
+
+        lang = at.sidebar.radio[0]
+        other = [o for o in lang.options if o != lang.value][0]
+        self.rerun(lang.set_value(other))
+
+    def run(self, iterations):
+        # Open the page, then repeat the flow
+        self.rerun()
+        for _ in range(iterations):
+            self.flow()
+        return self
+
+
+def session_worker(n, iterations, timeout, seed, barrier, queue):
+    s = None
+    failed = False
+    cold = 0.0
+    started = time.monotonic()
+    try:
+        s = Session(timeout, random.Random(seed + n))
+        # First run loads the workbook into this process's st.cache_data
+        s.rerun()
+        cold = s.latencies.pop()
+        s.check_loaded()
+        # Every session's cold run is bounded by the rerun timeout
+        barrier.wait(timeout=timeout * 2)
+        started = time.monotonic()
+        s.run(iterations)
+    except Exception as e:
+        # A timed-out or broken session still reports what it has, but as an error
+        print(f"  session {n} failed: {e!r}")
+        failed = True
+        barrier.abort()
+    queue.put({
+        "latencies": s.latencies if s else [],
+        "errors": (s.errors if s else 0) + failed,
+        "cold": cold,
+        "started": started,
+        "finished": time.monotonic(),
+        "rss": current_rss_mb(),
+        "peak_rss": peak_rss_mb(),
+    })
+
+
+def run_level(sessions, iterations, timeout, seed):
+    """
+    Run `sessions` users at once, one process each, and summarise their reruns.
+    """
+    barrier = multiprocessing.Barrier(sessions)
+    queue = multiprocessing.Queue()
+    procs = [
+        multiprocessing.Process(
+            target=session_worker, args=(n, iterations, timeout, seed, barrier, queue)
+        )
+        for n in range(sessions)
+    ]
+    for p in procs:
+        p.start()
+
+    # Setup and the barrier, then every rerun of every flow hitting the timeout
+    deadline = time.monotonic() + timeout * (3 + RERUNS_PER_FLOW * iterations)
+    results = []
+    for _ in procs:
+        try:
+            results.append(queue.get(timeout=max(deadline - time.monotonic(), 0.1)))
+        except Empty:
+            break
+    for p in procs:
+        p.join(timeout=1)
+        if p.is_alive():
+            p.terminate()
+            p.join()
+
+    # A session that died hard (OOM, segfault) or hung never reports back
+    missing = sessions - len(results)
+    if missing:
+        print(f"  {missing} session(s) did not report back")
+
+    latencies = [x for r in results for x in r["latencies"]]
+    elapsed = 0
+    if results:
+        elapsed = max(r["finished"] for r in results) - min(r["started"] for r in results)
+    return {
+        "sessions": sessions,
+        "reruns": len(latencies),
+        "errors": sum(r["errors"] for r in results) + missing,
+        "cold": max((r["cold"] for r in results), default=0) * 1000,
+        "p50": percentile(latencies, 50) * 1000,
+        "p90": percentile(latencies, 90) * 1000,
+        "p99": percentile(latencies, 99) * 1000,
+        "max": max(latencies, default=0) * 1000,
+        "mean": (statistics.mean(latencies) if latencies else 0) * 1000,
+        "throughput": len(latencies) / elapsed if elapsed > 0 else 0,
+        "rss": statistics.mean(r["rss"] for r in results) if results else 0,
+        "peak_rss": max((r["peak_rss"] for r in results), default=0),
+        "total_rss": sum(r["rss"] for r in results),
+    }
+
+
+def print_report(rows):
+    header = (
+        f"{'sessions':>8} {'reruns':>7} {'errors':>6} {'cold ms':>8} {'p50 ms':>8} {'p90 ms':>8} "
+        f"{'p99 ms':>8} {'max ms':>8} {'mean ms':>8} {'reruns/s':>9} "
+        f"{'rss MB':>8} {'peak MB':>8} {'total MB':>9}"
+    )
+    print(header)
+    print("-" * len(header))
+    for r in rows:
+        print(
+            f"{r['sessions']:>8} {r['reruns']:>7} {r['errors']:>6} {r['cold']:>8.1f} {r['p50']:>8.1f} "
+            f"{r['p90']:>8.1f} {r['p99']:>8.1f} {r['max']:>8.1f} {r['mean']:>8.1f} "
+            f"{r['throughput']:>9.1f} {r['rss']:>8.1f} {r['peak_rss']:>8.1f} {r['total_rss']:>9.1f}"
+        )
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Concurrent-session load test for app.py")
+    parser.add_argument("--levels", type=int, nargs="+", default=[1, 2, 4, 8, 16],
+                        help="number of concurrent sessions to try, one run per value")
+    parser.add_argument("--iterations", type=int, default=3,
+                        help="times each session repeats the full flow")
+    parser.add_argument("--vdcs", type=int, default=5, help="VDC sheets in the generated workbook")
+    parser.add_argument("--rows", type=int, default=5000, help="rows per VDC sheet")
+    parser.add_argument("--timeout", type=float, default=60,
+                        help="seconds a single rerun may take before it counts as failed")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--workbook", help="use this workbook instead of generating one")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        # Resolve before the chdir below so a relative --workbook still works
+        workbook = os.path.abspath(args.workbook) if args.workbook else None
+        if not workbook:
+            workbook = os.path.join(tmp, "data.xlsx")
+            print(f"Generating workbook: {args.vdcs} VDCs x {args.rows} rows")
+            make_workbook(workbook, args.vdcs, args.rows, args.seed)
+        os.environ["LAND_RECORD_DATA_FILE"] = workbook
+
+        # The app reads static/header.jpeg relative to the working directory
+        os.chdir(SCRIPT_DIR)
+
+        rows = []
+        for level in args.levels:
+            print(f"Running {level} session(s) x {args.iterations} flow(s)...")
+            rows.append(run_level(level, args.iterations, args.timeout, args.seed))
+
+    print()
+    print_report(rows)
+
+
+if __name__ == "__main__":
+    main()